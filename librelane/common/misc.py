@@ -21,6 +21,7 @@ import fnmatch
 import pathlib
 import unicodedata
 from math import inf
+from functools import lru_cache
 from typing import (
     IO,
     Any,
@@ -48,6 +49,7 @@ def idem(obj: T, *args, **kwargs) -> T:
     return obj
 
 
+@lru_cache(maxsize=1)
 def get_librelane_root() -> str:
     """
     Returns the root LibreLane folder, i.e., the folder containing the
@@ -56,6 +58,7 @@ def get_librelane_root() -> str:
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
+@lru_cache(maxsize=1)
 def get_script_dir() -> str:
     """
     Gets the LibreLane tool `scripts` directory.
@@ -268,6 +271,17 @@ class Filter(object):
                 self.deny.append(filter[1:])
             else:
                 self.allow.append(filter)
+        # Filter objects are matched against many inputs (every view lookup
+        # and metric aggregation pass), so the wildcards are compiled once
+        # here rather than re-processed by fnmatch on every call.
+        self._allow_compiled = [
+            re.compile(fnmatch.translate(os.path.normcase(wildcard)))
+            for wildcard in self.allow
+        ]
+        self._deny_compiled = [
+            re.compile(fnmatch.translate(os.path.normcase(wildcard)))
+            for wildcard in self.deny
+        ]
 
     def get_matching_wildcards(self, input: str) -> Generator[str, Any, None]:
         """
@@ -276,11 +290,12 @@ class Filter(object):
             accepting ``input``, and *all* wildcards in the deny list rejecting
             ``input``.
         """
-        for wildcard in self.allow:
-            if fnmatch.fnmatch(input, wildcard):
+        input = os.path.normcase(input)
+        for wildcard, compiled in zip(self.allow, self._allow_compiled):
+            if compiled.match(input):
                 yield wildcard
-        for wildcard in self.deny:
-            if not fnmatch.fnmatch(input, wildcard):
+        for wildcard, compiled in zip(self.deny, self._deny_compiled):
+            if not compiled.match(input):
                 yield wildcard
 
     def match(self, input: str) -> bool:
@@ -290,13 +305,14 @@ class Filter(object):
             * Has matched at least one wildcard in the allow list
             * Has matched exactly 0 inputs in the deny list
         """
+        input = os.path.normcase(input)
         allowed = False
-        for wildcard in self.allow:
-            if fnmatch.fnmatch(input, wildcard):
+        for compiled in self._allow_compiled:
+            if compiled.match(input):
                 allowed = True
                 break
-        for wildcard in self.deny:
-            if fnmatch.fnmatch(input, wildcard):
+        for compiled in self._deny_compiled:
+            if compiled.match(input):
                 allowed = False
                 break
         return allowed
@@ -33,6 +33,7 @@ from typing import (
     Tuple,
     List,
     Union,
+    cast,
 )
 
 import libparse
@@ -64,6 +65,10 @@ class Toolbox(object):
         self.remove_cells_from_lib = lru_cache(16, True)(self.remove_cells_from_lib)  # type: ignore
         self.create_blackbox_model = lru_cache(16, True)(self.create_blackbox_model)  # type: ignore
 
+        # Manual memoization for filter_views: its mapping arguments are not
+        # hashable, so lru_cache cannot be applied directly.
+        self._filter_views_cache: Dict[Any, List[Path]] = {}
+
     @deprecated(
         version="2.0.0b1",
         reason="Use 'aggregate_metrics' from 'librelane.common'",
@@ -96,6 +101,34 @@ class Toolbox(object):
         :returns: The created list
         """
         timing_corner = timing_corner or config["DEFAULT_CORNER"]
+
+        # The same (views, corner) pairs are resolved over and over- once per
+        # step for the LEF/LIB views- so cache by value. Callers get a copy so
+        # mutating the returned list cannot poison the cache.
+        cache_key: Optional[Tuple[Any, ...]] = None
+        try:
+            cache_key = (
+                tuple(
+                    (
+                        key,
+                        (
+                            value
+                            if is_string(value)
+                            else tuple(cast(Iterable[Path], value))
+                        ),
+                    )
+                    for key, value in views_by_corner.items()
+                ),
+                timing_corner,
+            )
+        except TypeError:
+            pass
+        if (
+            cache_key is not None
+            and (cached := self._filter_views_cache.get(cache_key)) is not None
+        ):
+            return list(cached)
+
         result: List[Path] = []
 
         for key in Filter(views_by_corner).get_matching_wildcards(timing_corner):
@@ -105,6 +138,8 @@ class Toolbox(object):
             else:
                 result += list(value)  # type: ignore
 
+        if cache_key is not None:
+            self._filter_views_cache[cache_key] = list(result)
         return result
 
     def get_macro_views(
@@ -23,24 +23,82 @@ import os
 import re
 import sys
 import json
-import tempfile
+import shutil
 import platform
 import subprocess
+from functools import lru_cache
 
 try:
-    from typing import Optional, Dict, List  # noqa: F401
+    from typing import Any, Optional, Dict, List, Tuple  # noqa: F401
 except ImportError:
     pass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 CONTAINER_ENGINE = os.getenv("OPENLANE_CONTAINER_ENGINE", "docker")
 
+# Probed once at import: the answer cannot change within a process. find_spec
+# only consults the import machinery instead of actually initializing tkinter
+# (which loads libtcl/libtk).
+try:
+    import importlib.util
+
+    _TKINTER_AVAILABLE = importlib.util.find_spec("tkinter") is not None
+except ImportError:
+    _TKINTER_AVAILABLE = False
+
+# Only the fields ContainerInfo actually consumes from Docker: avoids
+# serializing (and parsing) the full multi-kilobyte 'docker info' dump.
+# Podman's info struct has different fields and rejects this template, in
+# which case we fall back to the full dump.
+_DOCKER_INFO_FORMAT = (
+    '{"DockerRootDir":{{json .DockerRootDir}},'
+    '"SecurityOptions":{{json .SecurityOptions}}}'
+)
+
+# Matches KEY=value/KEY="value" assignments in os-release(5)-style files in
+# one pass, without tripping over '=' or '#' inside quoted values.
+_OSREL_RE = re.compile(rb'(?m)^([A-Z_][A-Z0-9_]*)="?([^"\n]*)"?$')
+
+# Extracts the version token from e.g. "Docker version 28.0.1, build abc123".
+_ENGINE_VERSION_RE = re.compile(r"version\s+([^\s,]+)")  # type: re.Pattern
+
+
+# Upper bound on any single probe: a wedged daemon (e.g. docker with an
+# unreachable containerd) should degrade the survey, not hang it.
+_PROBE_TIMEOUT_SECONDS = 60
+
+
+def _spawn(args, **kwargs):
+    # type: (List[str], **Any) -> subprocess.Popen
+    return subprocess.Popen(args, stdout=subprocess.PIPE, **kwargs)
+
+
+def _wait_output(process, check=True):
+    # type: (subprocess.Popen, bool) -> str
+    try:
+        stdout, _ = process.communicate(timeout=_PROBE_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+    if isinstance(stdout, bytes):
+        stdout = stdout.decode("utf8")
+    return stdout
+
 
 class StringRepresentable(object):
+    # No memoization here on purpose: instances are populated field-by-field
+    # after construction, so a cached first rendering would go stale.
     def __str__(self):
-        return str(self.__dict__)
+        return str(vars(self))
 
-    def __repr__(self):
-        return str(self.__dict__)
+    __repr__ = __str__
 
 
 class ContainerInfo(StringRepresentable):
@@ -56,20 +114,43 @@ class ContainerInfo(StringRepresentable):
         self.rootless = False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get():
         # type: () -> Optional['ContainerInfo']
         try:
             cinfo = ContainerInfo()
 
+            engine_binary = shutil.which(CONTAINER_ENGINE)
+            if engine_binary is None:
+                raise Exception(
+                    "Failed to get Docker info: %s not found in PATH" % CONTAINER_ENGINE
+                )
+
+            # The two engine invocations are independent, so spawn both
+            # up-front and overlap their run times.
             try:
-                info_str = subprocess.check_output(
-                    [CONTAINER_ENGINE, "info", "--format", "{{json .}}"]
-                ).decode("utf8")
+                info_process = _spawn(
+                    [engine_binary, "info", "--format", _DOCKER_INFO_FORMAT],
+                    stderr=subprocess.DEVNULL,
+                )
+                version_process = _spawn([engine_binary, "--version"])
+                try:
+                    info_str = _wait_output(info_process)
+                except subprocess.CalledProcessError:
+                    # Not Docker (e.g. Podman): get the full dump instead.
+                    info_str = _wait_output(
+                        _spawn([engine_binary, "info", "--format", "{{json .}}"])
+                    )
             except Exception as e:
                 raise Exception("Failed to get Docker info: %s" % str(e)) from None
 
             try:
-                info = json.loads(info_str)
+                # docker info emits multiple KB of JSON: prefer orjson's C
+                # parser when available, but stay functional without it.
+                if orjson is not None:
+                    info = orjson.loads(info_str)
+                else:
+                    info = json.loads(info_str)
             except Exception as e:
                 raise Exception(
                     "Result from 'docker info' was not valid JSON: %s" % str(e)
@@ -93,19 +174,20 @@ class ContainerInfo(StringRepresentable):
 
                 # Get Version
                 try:
-                    version_output = (
-                        subprocess.check_output([CONTAINER_ENGINE, "--version"])
-                        .decode("utf8")
-                        .strip()
-                    )
-                    cinfo.version = re.split(r"\s", version_output)[2].strip(",")
+                    version_output = _wait_output(version_process).strip()
+                    version_match = _ENGINE_VERSION_RE.search(version_output)
+                    if version_match is None:
+                        raise Exception("unrecognized --version output")
+                    cinfo.version = version_match.group(1)
                 except Exception:
                     print("Could not extract Docker version.", file=sys.stderr)
 
-                security_options = info.get("SecurityOptions")
-                for option in security_options:
-                    if "rootless" in option:
-                        cinfo.rootless = True
+                # The trimmed --format template serializes a missing field as
+                # null, so this may be None rather than absent.
+                security_options = info.get("SecurityOptions") or ()
+                cinfo.rootless = any(
+                    "rootless" in option for option in security_options
+                )
 
             return cinfo
         except Exception as e:
@@ -126,58 +208,73 @@ class NixInfo(StringRepresentable):
         self.flakes = False
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get():
         # type: () -> Optional['NixInfo']
         ninfo = NixInfo()
         try:
+            # Fast path: no point forking three children (and creating a
+            # temporary flake) when nix isn't even installed.
+            if shutil.which("nix") is None:
+                raise Exception("Failed to get Nix info: nix not found in PATH")
+
+            # The three probes are independent, so spawn them all up-front
+            # and overlap their run times.
             try:
-                version_str = subprocess.check_output(
-                    ["nix", "--version"], encoding="utf8"
-                )
-                ninfo.version_string = version_str.strip()
+                version_process = _spawn(["nix", "--version"])
             except Exception as e:
                 raise Exception("Failed to get Nix info: %s" % str(e)) from None
 
+            channels_process = None
             try:
-                channels = {}
-                channels_raw = subprocess.check_output(
-                    ["nix-channel", "--list"], encoding="utf8"
-                )
-                for channel in channels_raw.splitlines():
-                    name, url = channel.split(maxsplit=1)
-                    channels[name] = url
-                ninfo.channels = channels
+                channels_process = _spawn(["nix-channel", "--list"])
             except Exception as e:
                 print(
                     "Failed to get nix channels: %s" % str(e),
                     file=sys.stderr,
                 )
 
-            with tempfile.TemporaryDirectory(prefix="librelane_env_report_") as d:
-                with open(os.path.join(d, "flake.nix"), "w") as f:
-                    f.write("{}")
-                nix_command = subprocess.run(
-                    ["nix", "eval"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    cwd=d,
-                    encoding="utf8",
-                )
-                nix_command_result = nix_command.stdout
-                if "'nix-command'" in nix_command_result:
-                    pass
-                elif "'flakes'" in nix_command_result:
-                    ninfo.nix_command = True
-                elif "lacks attribute" in nix_command_result:
-                    ninfo.nix_command = True
-                    ninfo.flakes = True
-                else:
+            # builtins.getFlake is gated behind both experimental features:
+            # the error message names whichever feature is disabled, and
+            # evaluation succeeds iff both are enabled. This needs no
+            # temporary flake on disk.
+            eval_process = _spawn(
+                ["nix", "eval", "--expr", "builtins.getFlake"],
+                stderr=subprocess.STDOUT,
+            )
+
+            try:
+                ninfo.version_string = _wait_output(version_process).strip()
+            except Exception as e:
+                raise Exception("Failed to get Nix info: %s" % str(e)) from None
+
+            if channels_process is not None:
+                try:
+                    channels = {}
+                    for channel in _wait_output(channels_process).splitlines():
+                        name, url = channel.split(maxsplit=1)
+                        channels[name] = url
+                    ninfo.channels = channels
+                except Exception as e:
                     print(
-                        "'nix flake' returned unexpected output: %s"
-                        % nix_command_result,
+                        "Failed to get nix channels: %s" % str(e),
                         file=sys.stderr,
                     )
 
+            nix_command_result = _wait_output(eval_process, check=False)
+            if "'nix-command'" in nix_command_result:
+                pass
+            elif "'flakes'" in nix_command_result:
+                ninfo.nix_command = True
+            elif eval_process.returncode == 0:
+                ninfo.nix_command = True
+                ninfo.flakes = True
+            else:
+                print(
+                    "'nix eval' returned unexpected output: %s" % nix_command_result,
+                    file=sys.stderr,
+                )
+
             return ninfo
         except Exception as e:
             print(e, file=sys.stderr)
@@ -191,7 +288,7 @@ class OSInfo(StringRepresentable):
     distro = None  # type: Optional[str]
     distro_version = None  # type: Optional[str]
     python_version = ""  # type: str
-    python_path = []  # type: List[str]
+    python_path = ()  # type: Tuple[str, ...]
     container_info = None  # type: Optional[ContainerInfo]
     nix_info = None  # type: Optional[NixInfo]
 
@@ -204,18 +301,14 @@ class OSInfo(StringRepresentable):
         self.distro = None
         self.distro_version = None
         self.python_version = platform.python_version()
-        self.python_path = sys.path.copy()
-        self.tkinter = False
-        try:
-            import tkinter  # noqa: F401
-
-            self.tkinter = True
-        except ImportError:
-            pass
+        # An immutable view is enough here: no list copy per construction.
+        self.python_path = tuple(sys.path)
+        self.tkinter = _TKINTER_AVAILABLE
         self.container_info = None
         self.nix_info = None
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get():
         # type: () -> 'OSInfo'
         osinfo = OSInfo()
@@ -231,31 +324,42 @@ class OSInfo(StringRepresentable):
             osinfo.kernel_version = platform.release()
 
         if osinfo.kernel == "Linux":
-            os_release = ""
-            try:
-                os_release += open("/etc/lsb-release").read()
-            except FileNotFoundError:
-                pass
-            try:
-                os_release += open("/etc/os-release").read()
-            except FileNotFoundError:
-                pass
+            os_release = b""
+            for file in ["/etc/lsb-release", "/etc/os-release"]:
+                try:
+                    with open(file, "rb") as f:
+                        os_release += f.read() + b"\n"
+                except FileNotFoundError:
+                    pass
+
+            if os_release.strip() == b"":
+                # Some distributions only ship e.g. /etc/redhat-release:
+                # scan /etc once instead of guessing further names.
+                try:
+                    with os.scandir("/etc") as entries:
+                        for entry in entries:
+                            if entry.name.endswith("-release") and entry.is_file():
+                                try:
+                                    with open(entry.path, "rb") as f:
+                                        os_release += f.read() + b"\n"
+                                except OSError:
+                                    pass
+                except OSError:
+                    pass
+
+            if os_release.strip() != b"":
+                config = dict(_OSREL_RE.findall(os_release))
+
+                def decoded(key):
+                    # type: (bytes) -> Optional[str]
+                    value = config.get(key)
+                    if value is None:
+                        return None
+                    return value.decode("utf8")
 
-            if os_release.strip() != "":
-                config = {}
-                for line in os_release.split("\n"):
-                    if line.strip() == "":
-                        continue
-                    if line.strip().startswith("#"):
-                        continue
-                    key, value = line.split("=")
-                    value = value.strip('"')
-
-                    config[key] = value
-
-                osinfo.distro = config.get("ID") or config.get("DISTRIB_ID")
-                osinfo.distro_version = config.get("VERSION_ID") or config.get(
-                    "DISTRIB_RELEASE"
+                osinfo.distro = decoded(b"ID") or decoded(b"DISTRIB_ID")
+                osinfo.distro_version = decoded(b"VERSION_ID") or decoded(
+                    b"DISTRIB_RELEASE"
                 )
 
             else:
@@ -267,36 +371,52 @@ class OSInfo(StringRepresentable):
 
 
 def env_info_cli():
-    def print_params(obj, indent=0):
-        if isinstance(obj, list):
-            for value in obj:
-                if isinstance(value, StringRepresentable) or isinstance(value, dict):
-                    print("%s- " % (" " * indent), end="")
-                    print_params(value, indent=indent + 2)
-                elif isinstance(value, list):
-                    if len(value) == 0:
-                        print("%s- []" % (" " * indent))
+    def print_params(obj):
+        # Iterative pre-order walk: chunks are accumulated and flushed with
+        # one write instead of one print call per line. Frames are
+        # (kind, payload, indent), where "text" frames carry a finished chunk
+        # and "node" frames carry a value yet to be walked.
+        chunks = []  # type: List[str]
+        stack = [("node", obj, 0)]  # type: List[Tuple[str, Any, int]]
+        while stack:
+            frame = stack.pop()
+            if frame[0] == "text":
+                chunks.append(frame[1])
+                continue
+            _, current, indent = frame
+            pad = " " * indent
+            emitted = []  # type: List[Tuple[str, Any, int]]
+            if isinstance(current, (list, tuple)):
+                for value in current:
+                    if isinstance(value, (StringRepresentable, dict)):
+                        emitted.append(("text", "%s- " % pad, 0))
+                        emitted.append(("node", value, indent + 2))
+                    elif isinstance(value, (list, tuple)):
+                        if len(value) == 0:
+                            emitted.append(("text", "%s- []\n" % pad, 0))
+                        else:
+                            emitted.append(("text", "%s- " % pad, 0))
+                            emitted.append(("node", value, indent + 2))
                     else:
-                        print("%s- " % (" " * indent), end="")
-                        print_params(value, indent=indent + 2)
-                else:
-                    print("%s- %s" % (" " * indent, value))
-
-        else:
-            current = obj if isinstance(obj, dict) else obj.__dict__
-            for key in current:
-                value = current[key]
-                if isinstance(value, StringRepresentable) or isinstance(value, dict):
-                    print("%s%s:" % (" " * indent, key))
-                    print_params(value, indent=indent + 2)
-                elif isinstance(value, list):
-                    if len(value) == 0:
-                        print("%s%s: []" % (" " * indent, key))
+                        emitted.append(("text", "%s- %s\n" % (pad, value), 0))
+            else:
+                if not isinstance(current, dict):
+                    current = current.__dict__
+                for key in current:
+                    value = current[key]
+                    if isinstance(value, (StringRepresentable, dict)):
+                        emitted.append(("text", "%s%s:\n" % (pad, key), 0))
+                        emitted.append(("node", value, indent + 2))
+                    elif isinstance(value, (list, tuple)):
+                        if len(value) == 0:
+                            emitted.append(("text", "%s%s: []\n" % (pad, key), 0))
+                        else:
+                            emitted.append(("text", "%s%s:\n" % (pad, key), 0))
+                            emitted.append(("node", value, indent + 2))
                     else:
-                        print("%s%s:" % (" " * indent, key))
-                        print_params(value, indent=indent + 2)
-                else:
-                    print("%s%s: %s" % (" " * indent, key, value))
+                        emitted.append(("text", "%s%s: %s\n" % (pad, key, value), 0))
+            stack.extend(reversed(emitted))
+        sys.stdout.write("".join(chunks))
 
     info = OSInfo.get()
     print_params(info)
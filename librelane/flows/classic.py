@@ -11,10 +11,14 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from types import MappingProxyType
+from typing import Tuple, Type
+
 from .flow import Flow
 from .sequential import SequentialFlow
 from ..config import Variable
 from ..steps import (
+    Step,
     Yosys,
     OpenROAD,
     Magic,
@@ -27,6 +31,105 @@ from ..steps import (
 )
 
 
+# Each entry pairs a step with the Boolean config variables gating it (if
+# any). Classic's Steps and gating_config_vars are both derived from this
+# table so the pipeline is declared exactly once.
+_CLASSIC_PIPELINE: Tuple[Tuple[Type[Step], Tuple[str, ...]], ...] = (
+    (Verilator.Lint, ("RUN_LINTER",)),
+    (Checker.LintTimingConstructs, ("RUN_LINTER",)),
+    (Checker.LintErrors, ("RUN_LINTER",)),
+    (Checker.LintWarnings, ("RUN_LINTER",)),
+    (Yosys.JsonHeader, ()),
+    (Yosys.Synthesis, ()),
+    (Checker.YosysUnmappedCells, ()),
+    (Checker.YosysSynthChecks, ()),
+    (Checker.NetlistAssignStatements, ()),
+    (OpenROAD.CheckSDCFiles, ()),
+    (OpenROAD.CheckMacroInstances, ()),
+    (OpenROAD.STAPrePNR, ()),
+    (OpenROAD.Floorplan, ()),
+    (Odb.CheckMacroAntennaProperties, ()),
+    (Odb.SetPowerConnections, ()),
+    (Odb.ManualMacroPlacement, ()),
+    (OpenROAD.CutRows, ()),
+    (OpenROAD.TapEndcapInsertion, ("RUN_TAP_ENDCAP_INSERTION",)),
+    (Odb.AddPDNObstructions, ()),
+    (OpenROAD.GeneratePDN, ()),
+    (Odb.RemovePDNObstructions, ()),
+    (Odb.AddRoutingObstructions, ()),
+    (OpenROAD.GlobalPlacementSkipIO, ()),
+    (OpenROAD.IOPlacement, ()),
+    (Odb.CustomIOPlacement, ()),
+    (Odb.ApplyDEFTemplate, ()),
+    (OpenROAD.GlobalPlacement, ()),
+    (Odb.WriteVerilogHeader, ()),
+    (Checker.PowerGridViolations, ()),
+    (OpenROAD.STAMidPNR, ()),
+    (OpenROAD.RepairDesignPostGPL, ("RUN_POST_GPL_DESIGN_REPAIR",)),
+    (Odb.ManualGlobalPlacement, ()),
+    (OpenROAD.DetailedPlacement, ()),
+    (OpenROAD.CTS, ("RUN_CTS",)),
+    (OpenROAD.STAMidPNR, ()),
+    (OpenROAD.ResizerTimingPostCTS, ("RUN_POST_CTS_RESIZER_TIMING",)),
+    (OpenROAD.STAMidPNR, ()),
+    (OpenROAD.GlobalRouting, ()),
+    (OpenROAD.CheckAntennas, ()),
+    (OpenROAD.RepairDesignPostGRT, ("RUN_POST_GRT_DESIGN_REPAIR",)),
+    (Odb.DiodesOnPorts, ()),
+    (Odb.HeuristicDiodeInsertion, ("RUN_HEURISTIC_DIODE_INSERTION",)),
+    (OpenROAD.RepairAntennas, ("RUN_ANTENNA_REPAIR",)),
+    (OpenROAD.ResizerTimingPostGRT, ("RUN_POST_GRT_RESIZER_TIMING",)),
+    (OpenROAD.STAMidPNR, ()),
+    (OpenROAD.DetailedRouting, ("RUN_DRT",)),
+    (Odb.RemoveRoutingObstructions, ()),
+    (OpenROAD.CheckAntennas, ()),
+    (Checker.TrDRC, ("RUN_DRT",)),
+    (Odb.ReportDisconnectedPins, ()),
+    (Checker.DisconnectedPins, ()),
+    (Odb.ReportWireLength, ()),
+    (Checker.WireLength, ()),
+    (OpenROAD.FillInsertion, ("RUN_FILL_INSERTION",)),
+    (Odb.CellFrequencyTables, ()),
+    (OpenROAD.RCX, ("RUN_SPEF_EXTRACTION",)),
+    (OpenROAD.STAPostPNR, ("RUN_MCSTA",)),
+    (OpenROAD.IRDropReport, ("RUN_IRDROP_REPORT",)),
+    (Magic.StreamOut, ("RUN_MAGIC_STREAMOUT",)),
+    (KLayout.StreamOut, ("RUN_KLAYOUT_STREAMOUT",)),
+    (Magic.WriteLEF, ("RUN_MAGIC_WRITE_LEF",)),
+    (Odb.CheckDesignAntennaProperties, ()),
+    (
+        KLayout.XOR,
+        (
+            "RUN_KLAYOUT_XOR",
+            "RUN_MAGIC_STREAMOUT",
+            "RUN_KLAYOUT_STREAMOUT",
+        ),
+    ),
+    (
+        Checker.XOR,
+        (
+            "RUN_KLAYOUT_XOR",
+            "RUN_MAGIC_STREAMOUT",
+            "RUN_KLAYOUT_STREAMOUT",
+        ),
+    ),
+    (Magic.DRC, ("RUN_MAGIC_DRC",)),
+    (KLayout.DRC, ("RUN_KLAYOUT_DRC",)),
+    (Checker.MagicDRC, ("RUN_MAGIC_DRC",)),
+    (Checker.KLayoutDRC, ("RUN_KLAYOUT_DRC",)),
+    (Magic.SpiceExtraction, ()),
+    (Checker.IllegalOverlap, ()),
+    (Netgen.LVS, ("RUN_LVS",)),
+    (Checker.LVS, ("RUN_LVS",)),
+    (Yosys.EQY, ("RUN_EQY",)),
+    (Checker.SetupViolations, ()),
+    (Checker.HoldViolations, ()),
+    (Checker.MaxSlewViolations, ()),
+    (Checker.MaxCapViolations, ()),
+    (Misc.ReportManufacturability, ()),
+)
+
+
 @Flow.factory.register()
 class Classic(SequentialFlow):
     """
@@ -37,86 +140,9 @@ class Classic(SequentialFlow):
     This is the default when using LibreLane via the command-line.
     """
 
-    Steps = [
-        Verilator.Lint,
-        Checker.LintTimingConstructs,
-        Checker.LintErrors,
-        Checker.LintWarnings,
-        Yosys.JsonHeader,
-        Yosys.Synthesis,
-        Checker.YosysUnmappedCells,
-        Checker.YosysSynthChecks,
-        Checker.NetlistAssignStatements,
-        OpenROAD.CheckSDCFiles,
-        OpenROAD.CheckMacroInstances,
-        OpenROAD.STAPrePNR,
-        OpenROAD.Floorplan,
-        Odb.CheckMacroAntennaProperties,
-        Odb.SetPowerConnections,
-        Odb.ManualMacroPlacement,
-        OpenROAD.CutRows,
-        OpenROAD.TapEndcapInsertion,
-        Odb.AddPDNObstructions,
-        OpenROAD.GeneratePDN,
-        Odb.RemovePDNObstructions,
-        Odb.AddRoutingObstructions,
-        OpenROAD.GlobalPlacementSkipIO,
-        OpenROAD.IOPlacement,
-        Odb.CustomIOPlacement,
-        Odb.ApplyDEFTemplate,
-        OpenROAD.GlobalPlacement,
-        Odb.WriteVerilogHeader,
-        Checker.PowerGridViolations,
-        OpenROAD.STAMidPNR,
-        OpenROAD.RepairDesignPostGPL,
-        Odb.ManualGlobalPlacement,
-        OpenROAD.DetailedPlacement,
-        OpenROAD.CTS,
-        OpenROAD.STAMidPNR,
-        OpenROAD.ResizerTimingPostCTS,
-        OpenROAD.STAMidPNR,
-        OpenROAD.GlobalRouting,
-        OpenROAD.CheckAntennas,
-        OpenROAD.RepairDesignPostGRT,
-        Odb.DiodesOnPorts,
-        Odb.HeuristicDiodeInsertion,
-        OpenROAD.RepairAntennas,
-        OpenROAD.ResizerTimingPostGRT,
-        OpenROAD.STAMidPNR,
-        OpenROAD.DetailedRouting,
-        Odb.RemoveRoutingObstructions,
-        OpenROAD.CheckAntennas,
-        Checker.TrDRC,
-        Odb.ReportDisconnectedPins,
-        Checker.DisconnectedPins,
-        Odb.ReportWireLength,
-        Checker.WireLength,
-        OpenROAD.FillInsertion,
-        Odb.CellFrequencyTables,
-        OpenROAD.RCX,
-        OpenROAD.STAPostPNR,
-        OpenROAD.IRDropReport,
-        Magic.StreamOut,
-        KLayout.StreamOut,
-        Magic.WriteLEF,
-        Odb.CheckDesignAntennaProperties,
-        KLayout.XOR,
-        Checker.XOR,
-        Magic.DRC,
-        KLayout.DRC,
-        Checker.MagicDRC,
-        Checker.KLayoutDRC,
-        Magic.SpiceExtraction,
-        Checker.IllegalOverlap,
-        Netgen.LVS,
-        Checker.LVS,
-        Yosys.EQY,
-        Checker.SetupViolations,
-        Checker.HoldViolations,
-        Checker.MaxSlewViolations,
-        Checker.MaxCapViolations,
-        Misc.ReportManufacturability,
-    ]
+    # Declared immutable: SequentialFlow.__init_subclass__ takes a mutable
+    # copy per subclass, so the shared constants can never be aliased.
+    Steps = tuple(step for step, _ in _CLASSIC_PIPELINE)
 
     config_vars = [
         Variable(
@@ -264,49 +290,9 @@ class Classic(SequentialFlow):
         ),
     ]
 
-    gating_config_vars = {
-        "OpenROAD.RepairDesignPostGPL": ["RUN_POST_GPL_DESIGN_REPAIR"],
-        "OpenROAD.RepairDesignPostGRT": ["RUN_POST_GRT_DESIGN_REPAIR"],
-        "OpenROAD.ResizerTimingPostCTS": ["RUN_POST_CTS_RESIZER_TIMING"],
-        "OpenROAD.ResizerTimingPostGRT": ["RUN_POST_GRT_RESIZER_TIMING"],
-        "OpenROAD.CTS": ["RUN_CTS"],
-        "OpenROAD.RCX": ["RUN_SPEF_EXTRACTION"],
-        "OpenROAD.TapEndcapInsertion": ["RUN_TAP_ENDCAP_INSERTION"],
-        "Odb.HeuristicDiodeInsertion": ["RUN_HEURISTIC_DIODE_INSERTION"],
-        "OpenROAD.RepairAntennas": ["RUN_ANTENNA_REPAIR"],
-        "OpenROAD.DetailedRouting": ["RUN_DRT"],
-        "OpenROAD.FillInsertion": ["RUN_FILL_INSERTION"],
-        "OpenROAD.STAPostPNR": ["RUN_MCSTA"],
-        "OpenROAD.IRDropReport": ["RUN_IRDROP_REPORT"],
-        "Magic.StreamOut": ["RUN_MAGIC_STREAMOUT"],
-        "KLayout.StreamOut": ["RUN_KLAYOUT_STREAMOUT"],
-        "Magic.WriteLEF": ["RUN_MAGIC_WRITE_LEF"],
-        "Magic.DRC": ["RUN_MAGIC_DRC"],
-        "KLayout.DRC": ["RUN_KLAYOUT_DRC"],
-        "KLayout.XOR": [
-            "RUN_KLAYOUT_XOR",
-            "RUN_MAGIC_STREAMOUT",
-            "RUN_KLAYOUT_STREAMOUT",
-        ],
-        "Netgen.LVS": ["RUN_LVS"],
-        "Checker.TrDRC": ["RUN_DRT"],
-        "Checker.MagicDRC": ["RUN_MAGIC_DRC"],
-        "Checker.XOR": [
-            "RUN_KLAYOUT_XOR",
-            "RUN_MAGIC_STREAMOUT",
-            "RUN_KLAYOUT_STREAMOUT",
-        ],
-        "Checker.LVS": ["RUN_LVS"],
-        "Checker.KLayoutDRC": ["RUN_KLAYOUT_DRC"],
-        # Not in VHDLClassic
-        "Yosys.EQY": ["RUN_EQY"],
-        "Verilator.Lint": ["RUN_LINTER"],
-        "Checker.LintErrors": ["RUN_LINTER"],
-        "Checker.LintWarnings": ["RUN_LINTER"],
-        "Checker.LintTimingConstructs": [
-            "RUN_LINTER",
-        ],
-    }
+    gating_config_vars = MappingProxyType(
+        {step.id: list(gating) for step, gating in _CLASSIC_PIPELINE if len(gating)}
+    )
 
 
 @Flow.factory.register()
@@ -326,7 +326,7 @@ class Flow(ABC):
                 self.warnings[key] = Flow._StepWarningHandler.Record(record.msg, step)
 
     name: str = NotImplemented
-    Steps: List[Type[Step]] = NotImplemented  # Override
+    Steps: Sequence[Type[Step]] = NotImplemented  # Override
     config_vars: List[Variable] = []
     step_objects: Optional[List[Step]] = None
     run_dir: Optional[str] = None
@@ -357,7 +357,7 @@ class Flow(ABC):
         if name is not None:
             self.name = name
 
-        self.Steps = self.Steps.copy()  # Break global reference
+        self.Steps = list(self.Steps)  # Break global reference
 
         if not isinstance(config, Config):
             config, design_dir = Config.load(
@@ -18,6 +18,7 @@ import fnmatch
 from typing import (
     Iterable,
     List,
+    Mapping,
     Set,
     Tuple,
     Optional,
@@ -72,12 +73,16 @@ class SequentialFlow(Flow):
     """
 
     Substitutions: Optional[Dict[str, Union[str, Type[Step], None]]] = None
-    gating_config_vars: Dict[str, List[str]] = {}
+    # Declared as a Mapping so subclasses may use immutable declarations
+    # (e.g. MappingProxyType): __init_subclass__ takes a mutable copy anyway.
+    gating_config_vars: Mapping[str, List[str]] = {}
 
     def __init_subclass__(Self, scm_type=None, name=None, **kwargs):
-        Self.Steps = Self.Steps.copy()  # Break global reference
-        Self.config_vars = Self.config_vars.copy()
-        Self.gating_config_vars = Self.gating_config_vars.copy()
+        # Break global reference- also materializes immutable declarations
+        # (tuples, mapping proxies) into mutable copies for this subclass.
+        Self.Steps = list(Self.Steps)
+        Self.config_vars = list(Self.config_vars)
+        Self.gating_config_vars = dict(Self.gating_config_vars)
         if substitute := Self.Substitutions:
             for key, item in substitute.items():
                 Self.__substitute_step(Self, key, item)
@@ -142,7 +147,7 @@ class SequentialFlow(Flow):
         Substitute: Optional[Dict[str, Union[str, Type[Step], None]]] = None,
         **kwargs,
     ):
-        self.Steps = self.Steps.copy()  # Break global reference
+        self.Steps = list(self.Steps)  # Break global reference
 
         if substitute := Substitute:
             for key, item in substitute.items():
@@ -157,6 +162,9 @@ class SequentialFlow(Flow):
         id: str,
         with_step: Union[str, Type[Step], None],
     ):
+        # Work on a mutable copy: Flow declares Steps as a Sequence, so it is
+        # only assigned back wholesale, never mutated in place.
+        steps = list(target.Steps)
         step_indices: List[int] = []
         mode = "replace"
         if id.startswith("+"):
@@ -170,7 +178,7 @@ class SequentialFlow(Flow):
             if with_step is None:
                 raise FlowException("Cannot prepend or append None.")
 
-        for i, step in enumerate(target.Steps):
+        for i, step in enumerate(steps):
             if (
                 step.id
                 != NotImplemented  # Will be validated later by initialization: ignore for now
@@ -188,7 +196,8 @@ class SequentialFlow(Flow):
 
         if with_step is None:
             for index in reversed(step_indices):
-                del target.Steps[index]
+                del steps[index]
+            target.Steps = steps
             return
 
         if isinstance(with_step, str):
@@ -201,17 +210,19 @@ class SequentialFlow(Flow):
 
         for i in step_indices:
             if mode == "replace":
-                target.Steps[i] = with_step
+                steps[i] = with_step
             elif mode == "append":
-                target.Steps.insert(i + 1, with_step)
+                steps.insert(i + 1, with_step)
             elif mode == "prepend":
-                target.Steps.insert(i, with_step)
+                steps.insert(i, with_step)
+        target.Steps = steps
 
     @staticmethod
     def __normalize_step_ids(target: Union[SequentialFlow, Type[SequentialFlow]]):
         ids_used: Set[str] = set()
 
-        for i, step in enumerate(target.Steps):
+        steps = list(target.Steps)
+        for i, step in enumerate(steps):
             counter = 0
             id = step.id
             if (
@@ -222,8 +233,9 @@ class SequentialFlow(Flow):
                 counter += 1
                 id = f"{step.id}-{counter}"
             if id != step.id:
-                target.Steps[i] = step.with_id(id)
+                steps[i] = step.with_id(id)
             ids_used.add(id)
+        target.Steps = steps
 
     def run(
         self,
@@ -13,6 +13,8 @@
 # limitations under the License.
 import os
 import re
+import sys
+import time
 
 from collections import Counter
 from reader import click, click_odb, OdbReader
@@ -69,6 +71,27 @@ def main(
     )
 
     cells = [instance.getMaster().getName() for instance in block.getInsts()]
+    # The buffer list may still be getting extracted by a concurrent OpenROAD
+    # process; it is moved into place atomically once complete, so wait for
+    # it here, at the point it is first needed. If extraction fails, the
+    # parent leaves a sentinel next to it so we bail out immediately instead
+    # of waiting for the timeout.
+    failure_sentinel = f"{buffer_list}.failed"
+    deadline = time.monotonic() + 600
+    while not os.path.exists(buffer_list):
+        if os.path.exists(failure_sentinel):
+            print(
+                f"Extraction of the buffer list at '{buffer_list}' failed.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        if time.monotonic() > deadline:
+            print(
+                f"Timed out waiting for buffer list at '{buffer_list}'.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        time.sleep(0.1)
     buffers = open(buffer_list).read().split()
     buffer_frequency = Counter([cell for cell in cells if cell in buffers])
     cell_frequency = Counter(cells)
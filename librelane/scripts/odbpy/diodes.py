@@ -15,6 +15,7 @@
 # limitations under the License.
 
 import odb
+import utl
 
 import sys
 import click
@@ -109,24 +110,38 @@ class DiodeInserter:
         return False
 
     def net_manhattan_distance(self, net):
-        xs = []
-        ys = []
+        # Track the bounding box as we go instead of accumulating coordinate
+        # lists and re-scanning them with min()/max(): this runs once per net.
+        x_min = y_min = x_max = y_max = None
+
+        def include(x, y):
+            nonlocal x_min, y_min, x_max, y_max
+            if x_min is None:
+                x_min = x_max = x
+                y_min = y_max = y
+                return
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
 
         for bt in net.getBTerms():
             good, x, y = bt.getFirstPinLocation()
             if good:
-                xs.append(x)
-                ys.append(y)
+                include(x, y)
 
         for it in net.getITerms():
             x, y = self.pin_position(it)
-            xs.append(x)
-            ys.append(y)
+            include(x, y)
 
-        if len(xs) == 0:
+        if x_min is None:
             return 0
 
-        return (max(ys) - min(ys)) + (max(xs) - min(xs))
+        return (y_max - y_min) + (x_max - x_min)
 
     def pin_position(self, it):
         # px = odb.new_int(0)
@@ -291,12 +306,13 @@ class DiodeInserter:
             )
 
             # Scan all internal terminals
-            if len(net.getITerms()) == 0:
+            iterms = net.getITerms()
+            if len(iterms) == 0:
                 self.debug(
                     f"[d] Skipping net {net.getConstName():s}: not connected to any instances"
                 )
             else:
-                for iterm in net.getITerms():
+                for iterm in iterms:
                     self.insert_diode(net, iterm, src_pos)
 
 
@@ -364,6 +380,7 @@ def place(
     di.execute()
 
     print("Inserted", len(di.inserted), "diodes.")
+    utl.metric_integer("design__diode__inserted", len(di.inserted))
 
 
 cli.add_command(place)
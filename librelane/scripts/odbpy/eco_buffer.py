@@ -18,29 +18,40 @@ import grt as GRT
 
 
 def average_location(instances):
-    locations = [instance.getLocation() for instance in instances]
-    x_sum = sum(loc[0] for loc in locations)
-    y_sum = sum(loc[1] for loc in locations)
-    return (x_sum // len(locations), y_sum // len(locations))
+    x_sum = 0
+    y_sum = 0
+    for instance in instances:
+        x, y = instance.getLocation()
+        x_sum += x
+        y_sum += y
+    return (x_sum // len(instances), y_sum // len(instances))
 
 
 @click.command()
+@click.option(
+    "--dont-legalize",
+    is_flag=True,
+    default=False,
+    help="Skip legalization and incremental global routing. A separate detailed placement and global routing pass must follow.",
+)
 @click_odb
-def cli(reader):
+def cli(reader, dont_legalize):
     grt = reader.design.getGlobalRouter()
     dpl = reader.design.getOpendp()
 
+    grt_inc = None
     insts_to_temporarily_lock_then_unlock_later = []
-    for inst in reader.block.getInsts():
-        if inst.getPlacementStatus() != "LOCKED":
-            insts_to_temporarily_lock_then_unlock_later.append(
-                (inst, inst.getPlacementStatus())
-            )
-            inst.setPlacementStatus("LOCKED")
+    if not dont_legalize:
+        for inst in reader.block.getInsts():
+            if inst.getPlacementStatus() != "LOCKED":
+                insts_to_temporarily_lock_then_unlock_later.append(
+                    (inst, inst.getPlacementStatus())
+                )
+                inst.setPlacementStatus("LOCKED")
 
-    reader._grt_setup(grt)
+        reader._grt_setup(grt)
 
-    grt_inc = GRT.IncrementalGRoute(grt, reader.block)
+        grt_inc = GRT.IncrementalGRoute(grt, reader.block)
     i = 0
 
     for target_info in reader.config["INSERT_ECO_BUFFERS"]:
@@ -157,24 +168,26 @@ def cli(reader):
         eco_buffer.setOrient("R0")
         eco_buffer.setLocation(*eco_loc)
         eco_buffer.setPlacementStatus("PLACED")
-        grt.addDirtyNet(net)
-        grt.addDirtyNet(eco_net)
-
-    site = reader.rows[0].getSite()
-    max_disp_x = int(
-        reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_X"])
-        / site.getWidth()
-    )
-    max_disp_y = int(
-        reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_Y"])
-        / site.getHeight()
-    )
-    dpl.detailedPlacement(max_disp_x, max_disp_y)
-
-    grt_inc.updateRoutes(True)
-
-    for inst, previous_status in insts_to_temporarily_lock_then_unlock_later:
-        inst.setPlacementStatus(previous_status)
+        if grt_inc is not None:
+            grt.addDirtyNet(net)
+            grt.addDirtyNet(eco_net)
+
+    if grt_inc is not None:
+        site = reader.rows[0].getSite()
+        max_disp_x = int(
+            reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_X"])
+            / site.getWidth()
+        )
+        max_disp_y = int(
+            reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_Y"])
+            / site.getHeight()
+        )
+        dpl.detailedPlacement(max_disp_x, max_disp_y)
+
+        grt_inc.updateRoutes(True)
+
+        for inst, previous_status in insts_to_temporarily_lock_then_unlock_later:
+            inst.setPlacementStatus(previous_status)
 
 
 if __name__ == "__main__":
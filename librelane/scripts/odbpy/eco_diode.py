@@ -18,25 +18,33 @@ import grt as GRT
 
 
 @click.command()
+@click.option(
+    "--dont-legalize",
+    is_flag=True,
+    default=False,
+    help="Skip legalization and incremental global routing. A separate detailed placement and global routing pass must follow.",
+)
 @click_odb
-def cli(reader):
+def cli(reader, dont_legalize):
     grt = reader.design.getGlobalRouter()
     dpl = reader.design.getOpendp()
 
+    grt_inc = None
     insts_to_temporarily_lock_then_unlock_later = []
-    for inst in reader.block.getInsts():
-        if inst.getPlacementStatus() != "LOCKED":
-            insts_to_temporarily_lock_then_unlock_later.append(
-                (inst, inst.getPlacementStatus())
-            )
-            inst.setPlacementStatus("LOCKED")
+    if not dont_legalize:
+        for inst in reader.block.getInsts():
+            if inst.getPlacementStatus() != "LOCKED":
+                insts_to_temporarily_lock_then_unlock_later.append(
+                    (inst, inst.getPlacementStatus())
+                )
+                inst.setPlacementStatus("LOCKED")
+
+        reader._grt_setup(grt)
 
-    reader._grt_setup(grt)
+        grt_inc = GRT.IncrementalGRoute(grt, reader.block)
 
     diode_master, diode_pin = reader.config["DIODE_CELL"].split("/")
 
-    # print(grt)
-    grt_inc = GRT.IncrementalGRoute(grt, reader.block)
     i = 0
     for target_info in reader.config["INSERT_ECO_DIODES"]:
         target_name, target_pin = target_info["target"].split("/")
@@ -114,23 +122,25 @@ def cli(reader):
         eco_diode.setPlacementStatus("PLACED")
 
         diode_iterm.connect(net)
-        grt.addDirtyNet(net)
-
-    site = reader.rows[0].getSite()
-    max_disp_x = int(
-        reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_X"])
-        / site.getWidth()
-    )
-    max_disp_y = int(
-        reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_Y"])
-        / site.getHeight()
-    )
-    dpl.detailedPlacement(max_disp_x, max_disp_y)
-
-    grt_inc.updateRoutes(True)
-
-    for inst, previous_status in insts_to_temporarily_lock_then_unlock_later:
-        inst.setPlacementStatus(previous_status)
+        if grt_inc is not None:
+            grt.addDirtyNet(net)
+
+    if grt_inc is not None:
+        site = reader.rows[0].getSite()
+        max_disp_x = int(
+            reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_X"])
+            / site.getWidth()
+        )
+        max_disp_y = int(
+            reader.design.micronToDBU(reader.config["PL_MAX_DISPLACEMENT_Y"])
+            / site.getHeight()
+        )
+        dpl.detailedPlacement(max_disp_x, max_disp_y)
+
+        grt_inc.updateRoutes(True)
+
+        for inst, previous_status in insts_to_temporarily_lock_then_unlock_later:
+            inst.setPlacementStatus(previous_status)
 
     reader.design.writeDef("out.def")
 
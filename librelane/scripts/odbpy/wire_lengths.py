@@ -62,17 +62,22 @@ def main(
         report_out = f"{input_db}.wire_length.csv"
 
     block = db.getChip().getBlock()
-    dbunits = block.getDefUnits()
-    nets = list(filter(lambda net: net.getWire() is not None, block.getNets()))
-    nets.sort(key=lambda net: net.getWire().getLength(), reverse=True)
+    dbunits = Decimal(block.getDefUnits())
+    # Fetch each wire length exactly once- the getWire()/getLength() round
+    # trips into the database dominate on large designs.
+    lengths_by_net = [
+        (net, wire.getLength())
+        for net in block.getNets()
+        if (wire := net.getWire()) is not None
+    ]
+    lengths_by_net.sort(key=lambda pair: pair[1], reverse=True)
 
     max_wire_length = 0
     above_threshold = []
     with open(report_out, "w") as f:
         print("net,length_um", file=f)
-        for net in nets:
-            length = net.getWire().getLength()
-            length_microns = Decimal(length) / Decimal(dbunits)
+        for net, length in lengths_by_net:
+            length_microns = Decimal(length) / dbunits
             max_wire_length = max(length_microns, max_wire_length)
             if length_microns >= threshold:
                 above_threshold.append((net, length_microns))
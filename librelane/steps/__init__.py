@@ -33,6 +33,11 @@ from .step import (
 from .tclstep import TclStep
 from . import checker as Checker
 
+# The tool modules below are imported eagerly on purpose: importing them is
+# what runs their Step.factory.register() decorators, and anything that lists
+# or looks up steps (including the CLI) needs the full registry. Don't turn
+# these into lazy imports.
+#
 # You'll notice some TclStep subclasses are exposed separately-
 # this is for documentation.
 from . import yosys as Yosys
@@ -12,18 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-import re
 import json
 import shutil
+import hashlib
+import tempfile
 from math import inf
 from decimal import Decimal
 from abc import abstractmethod
+from threading import Thread
 from dataclasses import dataclass
 from typing import Dict, List, Literal, Optional, Tuple
 
-from ..common import Path, get_script_dir, aggregate_metrics
+from ..common import Path, get_script_dir, aggregate_metrics, mkdirp
 from ..config import Instance, Macro, Variable
-from ..logging import info, verbose
+from ..logging import info, verbose, warn
 from ..state import DesignFormat, State
 
 from .openroad import DetailedPlacement, GlobalRouting
@@ -40,10 +42,19 @@ from .step import (
 )
 from .tclstep import TclStep
 
-inf_rx = re.compile(r"\b(-?)inf\b")
-
 
 class OdbpyStep(Step):
+    """
+    An abstract base for steps that run an OpenDB Python script under
+    ``openroad -python``.
+
+    Each invocation is deliberately a fresh process that reloads the design
+    from the input state: steps may only communicate through the state and
+    the filesystem, and reproducibles depend on every step being replayable
+    as a standalone command. Do not try to keep a warm OpenROAD process or an
+    in-memory database across steps.
+    """
+
     inputs = [DesignFormat.ODB]
     outputs = [DesignFormat.ODB, DesignFormat.DEF]
 
@@ -77,8 +88,7 @@ class OdbpyStep(Step):
         for output in automatic_outputs:
             filename = f"{self.config['DESIGN_NAME']}.{output.value.extension}"
             file_path = os.path.join(self.step_dir, filename)
-            command.append(f"--output-{output.value.id}")
-            command.append(file_path)
+            command.extend((f"--output-{output.value.id}", file_path))
             views_updates[output] = Path(file_path)
 
         command += [
@@ -103,11 +113,10 @@ class OdbpyStep(Step):
         # 1. Parse warnings and errors
         self.alerts = subprocess_result.get("openroad_alerts") or []
         if subprocess_result["returncode"] != 0:
-            error_strings = [
+            error_string = "\n".join(
                 str(alert) for alert in self.alerts if alert.cls == "error"
-            ]
-            if len(error_strings):
-                error_string = "\n".join(error_strings)
+            )
+            if error_string:
                 raise StepError(
                     f"{self.id} failed with the following errors:\n{error_string}"
                 )
@@ -118,53 +127,76 @@ class OdbpyStep(Step):
         # 2. Metrics
         metrics_path = os.path.join(self.step_dir, "or_metrics_out.json")
         if os.path.exists(metrics_path):
-            or_metrics_out = json.loads(open(metrics_path).read(), parse_float=Decimal)
-            for key, value in or_metrics_out.items():
-                if value == "Infinity":
-                    or_metrics_out[key] = inf
-                elif value == "-Infinity":
-                    or_metrics_out[key] = -inf
+            # Parsed with stdlib json deliberately: metrics rely on
+            # parse_float=Decimal for exactness, which the C accelerators
+            # (orjson, ujson) do not support- they would degrade all floats.
+            with open(metrics_path) as f:
+                metrics_str = f.read()
+            or_metrics_out = json.loads(metrics_str, parse_float=Decimal)
+            # The sentinel can only occur if the substring is in the raw
+            # text- skip the per-value scan for the common, finite case.
+            has_infinity = "Infinity" in metrics_str
+            # Drop the raw buffer before aggregation so only the parsed
+            # dict contributes to peak memory on large metrics files.
+            del metrics_str
+            if has_infinity:
+                for key, value in or_metrics_out.items():
+                    if value == "Infinity":
+                        or_metrics_out[key] = inf
+                    elif value == "-Infinity":
+                        or_metrics_out[key] = -inf
             generated_metrics.update(or_metrics_out)
 
-        metric_updates_with_aggregates = aggregate_metrics(generated_metrics)
+        # Steps that emit no metrics at all can skip aggregation outright.
+        metric_updates_with_aggregates = (
+            aggregate_metrics(generated_metrics) if generated_metrics else {}
+        )
 
         return views_updates, metric_updates_with_aggregates
 
+    _base_command: Optional[Tuple[str, ...]] = None
+
     def get_command(self) -> List[str]:
+        # The base command is identical for every call on one step instance,
+        # while subclasses re-append their own arguments on top: compute it
+        # once, keep it as an immutable template and hand out list copies.
+        if self._base_command is not None:
+            return list(self._base_command)
+
         metrics_path = os.path.join(self.step_dir, "or_metrics_out.json")
 
-        tech_lefs = self.toolbox.filter_views(self.config, self.config["TECH_LEFS"])
+        config = self.config
+        tech_lefs = self.toolbox.filter_views(config, config["TECH_LEFS"])
         if len(tech_lefs) != 1:
             raise StepException(
                 "Misconfigured SCL: 'TECH_LEFS' must return exactly one Tech LEF for its default timing corner."
             )
 
-        lefs = ["--input-lef", str(tech_lefs[0])]
-        for lef in self.config["CELL_LEFS"]:
-            lefs.append("--input-lef")
-            lefs.append(lef)
-        if extra_lefs := self.config["EXTRA_LEFS"]:
+        lefs = ["--input-lef", os.fspath(tech_lefs[0])]
+        extend = lefs.extend
+        for lef in config["CELL_LEFS"]:
+            extend(("--input-lef", lef))
+        if extra_lefs := config["EXTRA_LEFS"]:
             for lef in extra_lefs:
-                lefs.append("--input-lef")
-                lefs.append(lef)
-        if (design_lef := self.state_in.result()[DesignFormat.LEF]) and (
-            DesignFormat.LEF in self.inputs
+                extend(("--input-lef", lef))
+        # Check the declared inputs before touching the state future, so
+        # steps that don't consume a design LEF never block on result().
+        if DesignFormat.LEF in self.inputs and (
+            design_lef := self.state_in.result()[DesignFormat.LEF]
         ):
-            lefs.append("--design-lef")
-            lefs.append(str(design_lef))
-        return (
-            [
-                "openroad",
-                "-exit",
-                "-no_splash",
-                "-metrics",
-                str(metrics_path),
-                "-python",
-                self.get_script_path(),
-            ]
-            + self.get_subcommand()
-            + lefs
+            lefs.extend(("--design-lef", str(design_lef)))
+        self._base_command = (
+            "openroad",
+            "-exit",
+            "-no_splash",
+            "-metrics",
+            os.fspath(metrics_path),
+            "-python",
+            self.get_script_path(),
+            *self.get_subcommand(),
+            *lefs,
         )
+        return list(self._base_command)
 
     @abstractmethod
     def get_script_path(self) -> str:
@@ -277,9 +309,17 @@ class ApplyDEFTemplate(OdbpyStep):
         design_area_string = self.state_in.result().metrics.get("design__die__bbox")
         if design_area_string:
             template_area_string = metrics_updates["design__die__bbox"]
-            template_area = [Decimal(point) for point in template_area_string.split()]
-            design_area = [Decimal(point) for point in design_area_string.split()]
-            if template_area != design_area:
+            # Both strings come from the same tool in the same format, so they
+            # are usually equal verbatim; only fall back to Decimal comparison
+            # for representation differences like "100" vs "100.0".
+            areas_match = template_area_string.split() == design_area_string.split()
+            if not areas_match:
+                template_area = [
+                    Decimal(point) for point in template_area_string.split()
+                ]
+                design_area = [Decimal(point) for point in design_area_string.split()]
+                areas_match = template_area == design_area
+            if not areas_match:
                 self.warn(
                     "The die area specificied in FP_DEF_TEMPLATE is different than the design die area. Pin placement may be incorrect."
                 )
@@ -413,29 +453,34 @@ class ManualMacroPlacement(OdbpyStep):
             )
             shutil.copyfile(cfg_ref, cfg_file)
         elif macros := self.config.get("MACROS"):
-            instance_count = sum(len(m.instances) for m in macros.values())
-            if instance_count >= 1:
-                with open(cfg_file, "w") as f:
-                    for module, macro in macros.items():
-                        if not isinstance(macro, Macro):
+            # Single flattening pass over the Macro dataclasses: the formatted
+            # lines are the only per-instance allocation.
+            lines: List[str] = []
+            append = lines.append
+            for module, macro in macros.items():
+                if not isinstance(macro, Macro):
+                    raise StepException(
+                        f"Misconstructed configuration: macro definition for key {module} is not of type 'Macro'."
+                    )
+                for name, data in macro.instances.items():
+                    location = data.location
+                    if location is not None:
+                        orientation = data.orientation
+                        if orientation is None:
                             raise StepException(
-                                f"Misconstructed configuration: macro definition for key {module} is not of type 'Macro'."
+                                f"Instance {name} of macro {module} has a location configured, but no orientation."
                             )
-                        for name, data in macro.instances.items():
-                            if data.location is not None:
-                                if data.orientation is None:
-                                    raise StepException(
-                                        f"Instance {name} of macro {module} has a location configured, but no orientation."
-                                    )
-                                f.write(
-                                    f"{name} {data.location[0]} {data.location[1]} {data.orientation}\n"
-                                )
-                            else:
-                                verbose(
-                                    f"Instance {name} of macro {module} has no location configured, ignoring…"
-                                )
-
-        if not cfg_file.exists():
+                        append(f"{name} {location[0]} {location[1]} {orientation}\n")
+                    else:
+                        verbose(
+                            f"Instance {name} of macro {module} has no location configured, ignoring…"
+                        )
+            if not lines:
+                info(f"No instances found, skipping '{self.id}'…")
+                return {}, {}
+            with open(cfg_file, "w") as f:
+                f.write("".join(lines))
+        else:
             info(f"No instances found, skipping '{self.id}'…")
             return {}, {}
 
@@ -510,10 +555,13 @@ class ReportDisconnectedPins(OdbpyStep):
         command = super().get_command()
         if ignored_modules := self.config["IGNORE_DISCONNECTED_MODULES"]:
             for module in ignored_modules:
-                command.append("--ignore-module")
-                command.append(module)
-        command.append("--write-full-table-to")
-        command.append(os.path.join(self.step_dir, "full_disconnected_pins_table.txt"))
+                command.extend(("--ignore-module", module))
+        command.extend(
+            (
+                "--write-full-table-to",
+                os.path.join(self.step_dir, "full_disconnected_pins_table.txt"),
+            )
+        )
         return command
 
 
@@ -546,8 +594,7 @@ class AddRoutingObstructions(OdbpyStep):
         command = super().get_command()
         if obstructions := self.config[self.config_vars[0].name]:
             for obstruction in obstructions:
-                command.append("--obstructions")
-                command.append(obstruction)
+                command.extend(("--obstructions", obstruction))
         return command
 
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
@@ -652,31 +699,32 @@ class CustomIOPlacement(OdbpyStep):
         return os.path.join(get_script_dir(), "odbpy", "io_place.py")
 
     def get_command(self) -> List[str]:
+        config = self.config
         length_args = []
-        if self.config["FP_IO_VLENGTH"] is not None:
-            length_args += ["--ver-length", self.config["FP_IO_VLENGTH"]]
-        if self.config["FP_IO_HLENGTH"] is not None:
-            length_args += ["--hor-length", self.config["FP_IO_HLENGTH"]]
+        if config["FP_IO_VLENGTH"] is not None:
+            length_args += ["--ver-length", config["FP_IO_VLENGTH"]]
+        if config["FP_IO_HLENGTH"] is not None:
+            length_args += ["--hor-length", config["FP_IO_HLENGTH"]]
 
         return (
             super().get_command()
             + [
                 "--config",
-                self.config["FP_PIN_ORDER_CFG"],
+                config["FP_PIN_ORDER_CFG"],
                 "--hor-layer",
-                self.config["FP_IO_HLAYER"],
+                config["FP_IO_HLAYER"],
                 "--ver-layer",
-                self.config["FP_IO_VLAYER"],
+                config["FP_IO_VLAYER"],
                 "--hor-width-mult",
-                str(self.config["FP_IO_VTHICKNESS_MULT"]),
+                str(config["FP_IO_VTHICKNESS_MULT"]),
                 "--ver-width-mult",
-                str(self.config["FP_IO_HTHICKNESS_MULT"]),
+                str(config["FP_IO_HTHICKNESS_MULT"]),
                 "--hor-extension",
-                str(self.config["FP_IO_HEXTEND"]),
+                str(config["FP_IO_HEXTEND"]),
                 "--ver-extension",
-                str(self.config["FP_IO_VEXTEND"]),
+                str(config["FP_IO_VEXTEND"]),
                 "--unmatched-error",
-                self.config["ERRORS_ON_UNMATCHED_IO"],
+                config["ERRORS_ON_UNMATCHED_IO"],
             ]
             + length_args
         )
@@ -779,6 +827,17 @@ class DiodesOnPorts(CompositeStep):
         GlobalRouting,
     ]
 
+    def stop_after(self, step: Step, state: State) -> bool:
+        # No diodes placed: legalization and global routing would only redo
+        # work on an unchanged design.
+        if (
+            isinstance(step, PortDiodePlacement)
+            and state.metrics.get("design__diode__inserted") == 0
+        ):
+            info("No diodes were inserted: skipping legalization and routing…")
+            return True
+        return False
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         if self.config["DIODE_ON_PORTS"] == "none":
             info("'DIODE_ON_PORTS' is set to 'none': skipping…")
@@ -886,6 +945,17 @@ class HeuristicDiodeInsertion(CompositeStep):
         GlobalRouting,
     ]
 
+    def stop_after(self, step: Step, state: State) -> bool:
+        # The heuristic found nothing to insert: legalization and global
+        # routing- the dominant cost of this composite- would be no-ops.
+        if (
+            isinstance(step, FuzzyDiodePlacement)
+            and state.metrics.get("design__diode__inserted") == 0
+        ):
+            info("No diodes were inserted: skipping legalization and routing…")
+            return True
+        return False
+
 
 @Step.factory.register()
 class CellFrequencyTables(OdbpyStep):
@@ -917,18 +987,103 @@ class CellFrequencyTables(OdbpyStep):
     def get_buffer_list_script(self):
         return os.path.join(get_script_dir(), "openroad", "buffer_list.tcl")
 
+    def get_buffer_list_cache_path(self, lib_list: List[Path]) -> Optional[str]:
+        """
+        Returns a cross-run cache location for the buffer list, keyed by the
+        resolved lib views (and the extracting script), or ``None`` if any of
+        them cannot be keyed.
+        """
+        hasher = hashlib.sha256()
+        for file in [self.get_buffer_list_script()] + [
+            os.fspath(lib) for lib in lib_list
+        ]:
+            try:
+                stat = os.stat(file)
+            except OSError:
+                return None
+            hasher.update(f"{file}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+        return os.path.join(
+            tempfile.gettempdir(),
+            "librelane-buffer-lists",
+            f"{hasher.hexdigest()}.txt",
+        )
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         kwargs, env = self.extract_env(kwargs)
 
-        env_copy = env.copy()
         lib_list = self.toolbox.filter_views(self.config, self.config["LIB"])
-        env_copy["_PNR_LIBS"] = TclStep.value_to_tcl(lib_list)
-        super().run_subprocess(
-            ["openroad", "-no_splash", "-exit", self.get_buffer_list_script()],
-            env=env_copy,
-            log_to=self.get_buffer_list_file(),
-        )
-        return super().run(state_in, env=env, **kwargs)
+        cache_path = self.get_buffer_list_cache_path(lib_list)
+        buffer_list_thread: Optional[Thread] = None
+        buffer_list_errors: List[BaseException] = []
+        if cache_path is not None and os.path.exists(cache_path):
+            # The buffer list depends only on the lib views, which have not
+            # changed since a previous flow run produced this entry: reuse it
+            # and save an OpenROAD cold start.
+            verbose(f"Reusing cached buffer list at '{cache_path}'…")
+            shutil.copyfile(cache_path, self.get_buffer_list_file())
+        else:
+            # Extract the buffer list concurrently with the main invocation:
+            # both pay the same LEF/LIB parsing cost, and cell_frequency.py
+            # only reads the list late, after the design is loaded. The log is
+            # renamed into place on success, so the script never observes a
+            # partial list.
+            env_copy = env.copy()
+            # _PNR_LIBS is a Tcl-list environment variable shared with the
+            # other OpenROAD scripts (common/io.tcl, gui.tcl)- keep the
+            # convention rather than inventing a file-based transport for
+            # this one consumer. It is only computed on a cache miss anyway.
+            env_copy["_PNR_LIBS"] = TclStep.value_to_tcl(lib_list)
+            scratch_log = f"{self.get_buffer_list_file()}.tmp"
+
+            def extract_buffer_list():
+                try:
+                    self.run_subprocess(
+                        [
+                            "openroad",
+                            "-no_splash",
+                            "-exit",
+                            self.get_buffer_list_script(),
+                        ],
+                        env=env_copy,
+                        log_to=scratch_log,
+                        silent=True,
+                    )
+                    os.replace(scratch_log, self.get_buffer_list_file())
+                except BaseException as e:
+                    buffer_list_errors.append(e)
+                    # Let cell_frequency.py fail fast instead of polling for
+                    # the buffer list until its timeout expires.
+                    try:
+                        open(f"{self.get_buffer_list_file()}.failed", "w").close()
+                    except OSError:
+                        pass
+                    return
+                if cache_path is not None:
+                    # Populating the cache is best-effort: a read-only or full
+                    # temporary directory should not fail the step when the
+                    # buffer list itself was extracted successfully.
+                    try:
+                        mkdirp(os.path.dirname(cache_path))
+                        # Copy then rename so concurrent flows only ever see
+                        # complete cache entries.
+                        scratch_path = f"{cache_path}.{os.getpid()}"
+                        shutil.copyfile(self.get_buffer_list_file(), scratch_path)
+                        os.replace(scratch_path, cache_path)
+                    except OSError as e:
+                        warn(f"Failed to cache the buffer list: {e}")
+
+            buffer_list_thread = Thread(target=extract_buffer_list, daemon=True)
+            buffer_list_thread.start()
+        try:
+            views_updates, metrics_updates = super().run(state_in, env=env, **kwargs)
+        finally:
+            if buffer_list_thread is not None:
+                buffer_list_thread.join()
+            if buffer_list_errors:
+                raise StepException(
+                    f"Failed to extract the buffer list: {buffer_list_errors[0]}"
+                ) from buffer_list_errors[0]
+        return views_updates, metrics_updates
 
     def get_command(self) -> List[str]:
         command = super().get_command()
@@ -1013,6 +1168,10 @@ class InsertECOBuffers(OdbpyStep):
     id = "Odb.InsertECOBuffers"
     name = "Insert ECO Buffers"
 
+    # Concatenated eagerly on purpose: config_vars is read as a plain class
+    # attribute throughout (CompositeStep.__init_subclass__, documentation
+    # generators), and the Variable objects themselves are shared- only the
+    # small list shells are copied, once, at import.
     config_vars = (
         dpl_variables
         + grt_variables
@@ -1030,8 +1189,19 @@ class InsertECOBuffers(OdbpyStep):
 
     def get_command(self) -> List[str]:
         assert self.config_path is not None, "get_command called before start()"
+        # config.json is step-filtered, not the whole flow config, and the
+        # child needs more than the ECO list from it (the DPL/GRT sections
+        # used by reader.dpl()/reader.grt()). It also keeps the command
+        # replayable from the step directory, so don't move it to stdin.
         return super().get_command() + ["--step-config", self.config_path]
 
+    def run(self, state_in: State, **kwargs):
+        # None and [] alike: don't pay for an OpenROAD cold start to no-op.
+        if not self.config["INSERT_ECO_BUFFERS"]:
+            info(f"No ECO buffers configured. Skipping '{self.id}'…")
+            return {}, {}
+        return super().run(state_in, **kwargs)
+
 
 @dataclass
 class ECODiode:
@@ -1085,4 +1255,71 @@ class InsertECODiodes(OdbpyStep):
         if self.config["DIODE_CELL"] is None:
             info(f"'DIODE_CELL' not set. Skipping '{self.id}'…")
             return {}, {}
+        # None and [] alike: don't pay for an OpenROAD cold start to no-op.
+        if not self.config["INSERT_ECO_DIODES"]:
+            info(f"No ECO diodes configured. Skipping '{self.id}'…")
+            return {}, {}
+        return super().run(state_in, **kwargs)
+
+
+@Step.factory.register()
+class ECOBufferPlacement(InsertECOBuffers):
+    """
+    A variant of ``Odb.InsertECOBuffers`` that does *not* legalize the inserted
+    buffers or update global routing- a separate detailed placement and global
+    routing pass must follow. Used as part of ``Odb.InsertECOFixes``.
+    """
+
+    id = "Odb.ECOBufferPlacement"
+    name = "ECO Buffer Placement"
+
+    def get_command(self) -> List[str]:
+        return super().get_command() + ["--dont-legalize"]
+
+
+@Step.factory.register()
+class ECODiodePlacement(InsertECODiodes):
+    """
+    A variant of ``Odb.InsertECODiodes`` that does *not* legalize the inserted
+    diodes or update global routing- a separate detailed placement and global
+    routing pass must follow. Used as part of ``Odb.InsertECOFixes``.
+    """
+
+    id = "Odb.ECODiodePlacement"
+    name = "ECO Diode Placement"
+
+    def get_command(self) -> List[str]:
+        return super().get_command() + ["--dont-legalize"]
+
+
+@Step.factory.register()
+class InsertECOFixes(CompositeStep):
+    """
+    Inserts both ECO buffers and ECO diodes, then legalizes the placement and
+    re-runs global routing once over the combined result.
+
+    Equivalent to running ``Odb.InsertECOBuffers`` followed by
+    ``Odb.InsertECODiodes``, but with a single detailed placement and global
+    routing pass over the union of affected nets instead of one of each per
+    step.
+    """
+
+    id = "Odb.InsertECOFixes"
+    name = "Insert ECO Fixes"
+    long_name = "ECO Buffer and Diode Insertion Routine"
+
+    Steps = [
+        ECOBufferPlacement,
+        ECODiodePlacement,
+        DetailedPlacement,
+        GlobalRouting,
+    ]
+
+    def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
+        if (
+            not self.config["INSERT_ECO_BUFFERS"]
+            and not self.config["INSERT_ECO_DIODES"]
+        ):
+            info(f"No ECO buffers or diodes configured. Skipping '{self.id}'…")
+            return {}, {}
         return super().run(state_in, **kwargs)
@@ -25,6 +25,7 @@ import subprocess
 from signal import Signals
 from decimal import Decimal
 from io import TextIOWrapper
+from queue import SimpleQueue
 from threading import Thread
 from inspect import isabstract
 from itertools import zip_longest
@@ -853,7 +854,7 @@ class Step(ABC):
         Self,
         step_dir: str,
         pdk_root: Optional[str] = None,
-        search_steps: Optional[List[Type[Step]]] = None,
+        search_steps: Optional[Sequence[Type[Step]]] = None,
     ) -> "Step":
         config_path = os.path.join(step_dir, "config.json")
         state_in_path = os.path.join(step_dir, "state_in.json")
@@ -1151,6 +1152,10 @@ class Step(ABC):
         with open(os.path.join(self.step_dir, "state_in.json"), "w") as f:
             f.write(state_in_result.dumps())
 
+        # Serialized with stdlib json deliberately: GenericDictEncoder handles
+        # Decimal (and other config value types) losslessly, and loaders
+        # re-parse this file with parse_float=Decimal- properties the faster
+        # C encoders (orjson et al.) cannot provide.
         self.config_path = os.path.join(self.step_dir, "config.json")
         with open(self.config_path, "w") as f:
             config_mut = self.config.to_raw_dict()
@@ -1354,15 +1359,31 @@ class Step(ABC):
 
         line_buffer = RingBuffer(str, 10)
         if process_stdout := process.stdout:
-            try:
-                for line in process_stdout:
-                    log_file.write(line)
-                    line_buffer.push(line)
-                    for processor in output_processors:
-                        if processor.process_line(line):
-                            break
-            except UnicodeDecodeError as e:
-                raise StepException(f"Subprocess emitted non-UTF-8 output: {e}")
+            # The pipe is drained on a dedicated thread so a slow output
+            # processor (or log filesystem) can never back the pipe up and
+            # stall the child.
+            line_queue: SimpleQueue = SimpleQueue()
+
+            def drain(stream):
+                try:
+                    for line in stream:
+                        line_queue.put(line)
+                except UnicodeDecodeError as e:
+                    line_queue.put(e)
+                finally:
+                    line_queue.put(None)
+
+            drain_thread = Thread(target=drain, args=(process_stdout,), daemon=True)
+            drain_thread.start()
+            while (item := line_queue.get()) is not None:
+                if isinstance(item, UnicodeDecodeError):
+                    raise StepException(f"Subprocess emitted non-UTF-8 output: {item}")
+                log_file.write(item)
+                line_buffer.push(item)
+                for processor in output_processors:
+                    if processor.process_line(item):
+                        break
+            drain_thread.join()
         process_stats_thread.join()
 
         json_stats = f"{os.path.splitext(log_path)[0]}.process_stats.json"
@@ -1541,6 +1562,15 @@ class CompositeStep(Step):
             Self.outputs = list(output_set)
         Self.config_vars = list(config_var_dict.values())
 
+    def stop_after(self, step: "Step", state: State) -> bool:
+        """
+        A hook called after each constituent step finishes. Subclasses may
+        return ``True`` to skip the remaining steps, e.g. when an earlier step
+        reports there is nothing left to do. The state and metrics produced so
+        far are still propagated.
+        """
+        return False
+
     def run(self, state_in: State, **kwargs) -> Tuple[ViewsUpdate, MetricsUpdate]:
         state = state_in
         step_count = len(self.Steps)
@@ -1555,6 +1585,8 @@ class CompositeStep(Step):
                 step_dir=step_dir,
                 _no_rule=True,
             )
+            if self.stop_after(step, state):
+                break
 
         views_updates: dict = {}
         metrics_updates: dict = {}
@@ -0,0 +1,136 @@
+# Copyright 2025 LibreLane Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+from typing import List, Optional
+
+import pytest
+
+from librelane.steps import step
+
+mock_variables = pytest.mock_variables
+
+
+def eco_config_dict(dir, config_vars):
+    config_dict = {
+        "DESIGN_NAME": "whatever",
+        "DESIGN_DIR": dir,
+        "EXAMPLE_PDK_VAR": "bla",
+        "PDK_ROOT": "/pdk",
+        "PDK": "dummy",
+        "STD_CELL_LIBRARY": "dummy_scl",
+        "VERILOG_FILES": ["/cwd/src/a.v", "/cwd/src/b.v"],
+        "GRT_REPAIR_ANTENNAS": True,
+        "RUN_HEURISTIC_DIODE_INSERTION": False,
+        "MACROS": None,
+        "DIODE_ON_PORTS": None,
+        "TECH_LEFS": {
+            "nom_*": "/pdk/dummy/libs.ref/techlef/dummy_scl/dummy_tech_lef.tlef"
+        },
+        "CELL_LEFS": [],
+        "EXTRA_LEFS": None,
+        "DEFAULT_CORNER": "nom_tt_025C_1v80",
+        "RANDOM_ARRAY": None,
+        "INSERT_ECO_BUFFERS": None,
+        "INSERT_ECO_DIODES": None,
+    }
+    for variable in config_vars:
+        config_dict.setdefault(variable.name, variable.default)
+    return config_dict
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+@mock_variables([step])
+def test_insert_eco_fixes_skip(caplog: pytest.LogCaptureFixture):
+    from librelane.config import Config
+    from librelane.state import State
+    from librelane.steps import Odb
+
+    dir = os.getcwd()
+
+    eco_fixes_step = Odb.InsertECOFixes(
+        config=Config(eco_config_dict(dir, Odb.InsertECOFixes.config_vars)),
+        state_in=State(),
+        _no_revalidate_conf=True,
+    )
+    views_update, metrics_update = eco_fixes_step.run(State())
+
+    assert views_update == {}, "InsertECOFixes did not skip -- tainted views_update"
+    assert metrics_update == {}, "InsertECOFixes did not skip -- tainted metrics_update"
+    assert (
+        "No ECO buffers or diodes configured" in caplog.text
+    ), "InsertECOFixes did not log the reason for skipping"
+
+
+@pytest.mark.usefixtures("_chdir_tmp")
+@mock_variables([step])
+def test_eco_placement_variants_skip_legalization():
+    from librelane.common import Path
+    from librelane.config import Config, Variable
+    from librelane.state import DesignFormat, State
+    from librelane.steps import Odb
+
+    dir = os.getcwd()
+    state_in = State({DesignFormat.ODB: "whatever.odb"})
+
+    # The LEF variables read by OdbpyStep.get_command are not part of the
+    # mocked flow variables, so they are declared per test step instead.
+    lef_vars = [
+        Variable("CELL_LEFS", List[Path], description="x", pdk=True),
+        Variable("EXTRA_LEFS", Optional[List[Path]], description="x", default=None),
+    ]
+
+    for PlacementVariant, BaseStep in [
+        (Odb.ECOBufferPlacement, Odb.InsertECOBuffers),
+        (Odb.ECODiodePlacement, Odb.InsertECODiodes),
+    ]:
+        assert issubclass(
+            PlacementVariant, BaseStep
+        ), f"{PlacementVariant.id} is not a variant of {BaseStep.id}"
+
+        class Variant(PlacementVariant):
+            id = PlacementVariant.id
+            step_dir = dir
+            config_vars = PlacementVariant.config_vars + lef_vars
+
+        class Base(BaseStep):
+            id = BaseStep.id
+            step_dir = dir
+            config_vars = BaseStep.config_vars + lef_vars
+
+        config = Config(eco_config_dict(dir, Variant.config_vars))
+        variant_step = Variant(
+            config=config,
+            state_in=state_in,
+            _no_revalidate_conf=True,
+        )
+        variant_step.config_path = os.path.join(dir, "config.json")
+        base_step = Base(
+            config=config,
+            state_in=state_in,
+            _no_revalidate_conf=True,
+        )
+        base_step.config_path = os.path.join(dir, "config.json")
+
+        variant_command = variant_step.get_command()
+        base_command = base_step.get_command()
+
+        assert (
+            "--dont-legalize" in variant_command
+        ), f"{Variant.id} does not pass --dont-legalize"
+        assert (
+            "--dont-legalize" not in base_command
+        ), f"{Base.id} unexpectedly passes --dont-legalize"
+        assert base_command == [
+            flag for flag in variant_command if flag != "--dont-legalize"
+        ], f"{Variant.id} and {Base.id} differ beyond --dont-legalize"
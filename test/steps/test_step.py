@@ -452,3 +452,57 @@ def test_run_subprocess(mock_run):
 
     with pytest.raises(StepException, match="non-UTF-8"):
         step.start(step_dir=".")
+
+
+@pytest.mark.usefixtures("_mock_conf_fs")
+@mock_variables([step])
+def test_composite_step_stop_after(mock_config):
+    from librelane.common import Toolbox
+    from librelane.state import State
+    from librelane.steps import Step
+    from librelane.steps.step import CompositeStep
+
+    steps_run = []
+
+    class DiodeCounter(Step):
+        inputs = []
+        outputs = []
+        id = "Test.DiodeCounter"
+
+        def run(self, state_in, **kwargs):
+            steps_run.append(self.id)
+            return {}, {"design__diode__inserted": 0}
+
+    class NeverReached(Step):
+        inputs = []
+        outputs = []
+        id = "Test.NeverReached"
+
+        def run(self, state_in, **kwargs):
+            steps_run.append(self.id)
+            return {}, {"never__reached": 1}
+
+    class TestComposite(CompositeStep):
+        id = "Test.Composite"
+        Steps = [DiodeCounter, NeverReached]
+
+        def stop_after(self, step, state):
+            return state.metrics.get("design__diode__inserted") == 0
+
+    composite = TestComposite(
+        config=mock_config,
+        state_in=State(),
+    )
+    state_out = composite.start(
+        toolbox=Toolbox(tmp_dir="/cwd"),
+        step_dir="/cwd/composite",
+    )
+    assert steps_run == [
+        "Test.DiodeCounter"
+    ], "Composite did not halt after stop_after returned True"
+    assert (
+        state_out.metrics.get("design__diode__inserted") == 0
+    ), "Composite did not propagate the partial state's metrics"
+    assert (
+        "never__reached" not in state_out.metrics
+    ), "Composite ran a step past the stop_after cutoff"